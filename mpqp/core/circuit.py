@@ -21,9 +21,10 @@ could be use to add CNOT gates to your circuit, using the two registers
 from __future__ import annotations
 
 from copy import deepcopy
+from functools import reduce
 from numbers import Complex
 from pickle import dumps
-from typing import TYPE_CHECKING, Iterable, Optional, Sequence, Type, Union
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence, Type, Union
 
 if TYPE_CHECKING:
     from qat.core.wrappers.circuit import Circuit as myQLM_Circuit
@@ -41,6 +42,7 @@ from mpqp.core.instruction.barrier import Barrier
 from mpqp.core.instruction.gates import ControlledGate, CRk, Gate, Id
 from mpqp.core.instruction.gates.custom_gate import CustomGate
 from mpqp.core.instruction.gates.gate_definition import UnitaryMatrix
+from mpqp.core.instruction.gates.native_gates import NativeGate
 from mpqp.core.instruction.gates.parametrized_gate import ParametrizedGate
 from mpqp.core.instruction.measurement import BasisMeasure, ComputationalBasis, Measure
 from mpqp.core.instruction.measurement.expectation_value import ExpectationMeasure
@@ -51,7 +53,7 @@ from mpqp.qasm.open_qasm_2_and_3 import open_qasm_2_to_3
 from mpqp.qasm.qasm_to_braket import qasm3_to_braket_Circuit
 from mpqp.qasm.qasm_to_cirq import qasm2_to_cirq_Circuit
 from mpqp.tools.errors import NumberQubitsError
-from mpqp.tools.generics import OneOrMany
+from mpqp.tools.generics import Matrix, OneOrMany
 from mpqp.tools.maths import matrix_eq
 
 
@@ -512,26 +514,98 @@ class QCircuit:
         # - to avoid multi-qubit gates
         ...
 
-    def to_matrix(self) -> npt.NDArray[np.complex64]:
-        """Compute the unitary matrix associated to this circuit.
+    def to_matrix(self) -> Matrix:
+        r"""Compute the unitary matrix associated to this circuit.
+
+        The gates are never expanded into full `2^n\times 2^n` operators:
+        the unitary is seen as a tensor with one axis per qubit, and each gate
+        is only contracted along the axes of the qubits it acts upon. In
+        addition, consecutive single qubit gates are first multiplied together
+        on their qubit, and only applied to the unitary when a multi-qubit gate
+        needs it.
+
+        Note:
+            Only the gates are taken into account, measurements, barriers and
+            noise models are ignored.
 
         Returns:
-            a unitary matrix representing this circuit
+            a unitary matrix representing this circuit, of complex numbers, or
+            of ``sympy`` expressions (with an ``object`` dtype) if some gates
+            still contain free symbols.
 
         Examples:
             >>> c = QCircuit([H(0), CNOT(0,1)])
-            >>> c.to_matrix()
-            array([[ 0.70710678,  0.        ,  0.70710678,  0.        ],
-                   [ 0.        ,  0.70710678,  0.        ,  0.70710678],
-                   [ 0.        ,  0.70710678,  0.        , -0.70710678],
-                   [ 0.70710678,  0.        , -0.70710678,  0.        ]])
-
-        # 3M-TODO implement and double check examples and test:
-        the idea is to compute the tensor product of the matrices associated
-        with the gates of the circuit in a clever way (to minimize the number of
-        multiplications) and then return the big matrix
+            >>> print(clean_matrix(c.to_matrix()))
+            [[0.7071068, 0, 0.7071068, 0],
+             [0, 0.7071068, 0, 0.7071068],
+             [0, 0.7071068, 0, -0.7071068],
+             [0.7071068, 0, -0.7071068, 0]]
+
         """
-        ...
+        local_ops: dict[int, npt.NDArray[Any]] = {}
+        result = None
+        # native gates with the same type and parameters share the same matrix
+        native_matrices: dict[tuple[object, ...], npt.NDArray[Any]] = {}
+
+        for instruction in self.instructions:
+            if not isinstance(instruction, Gate):
+                continue
+            qubits = instruction.targets
+            if isinstance(instruction, ControlledGate):
+                qubits = instruction.controls + qubits
+
+            matrix: npt.NDArray[Any]
+            key = None
+            if isinstance(instruction, NativeGate):
+                key = (type(instruction), *getattr(instruction, "parameters", []))
+            if key in native_matrices:
+                matrix = native_matrices[key]
+            else:
+                matrix = np.asarray(instruction.to_matrix())
+                if matrix.dtype == object:
+                    # a single ``sympy`` matrix would force all the following
+                    # products to be done element by element in python, so we
+                    # go back to numbers as soon as there is no free symbol left
+                    try:
+                        matrix = matrix.astype(complex)
+                    except TypeError:
+                        pass
+                if key is not None:
+                    native_matrices[key] = matrix
+
+            if len(qubits) == 1:
+                qubit = qubits[0]
+                local_ops[qubit] = (
+                    matrix @ local_ops[qubit] if qubit in local_ops else matrix
+                )
+                continue
+
+            if result is None:
+                # up to the first multi-qubit gate, the circuit is a tensor
+                # product of single qubit operators
+                result = self._local_ops_product(local_ops)
+                local_ops = {}
+            else:
+                for qubit in qubits:
+                    if qubit in local_ops:
+                        result = _apply_matrix(result, local_ops.pop(qubit), [qubit])
+            result = _apply_matrix(result, matrix, qubits)
+
+        if result is None:
+            return self._local_ops_product(local_ops)
+        for qubit, local_op in local_ops.items():
+            result = _apply_matrix(result, local_op, [qubit])
+        return result
+
+    def _local_ops_product(self, local_ops: dict[int, npt.NDArray[Any]]) -> Matrix:
+        """Tensor product of the operators in ``local_ops`` (indexed by the
+        qubit they act on), the identity being used for the missing qubits."""
+        identity = np.eye(2, dtype=complex)
+        return reduce(
+            np.kron,
+            [local_ops.get(qubit, identity) for qubit in range(self.nb_qubits)],
+            np.eye(1, dtype=complex),
+        )
 
     def inverse(self) -> QCircuit:
         """Generate the inverse (dagger) of this circuit.
@@ -1122,3 +1196,26 @@ class QCircuit:
                     if isinstance(param, Expr):
                         params.update(param.free_symbols)
         return params
+
+
+def _apply_matrix(unitary: Matrix, matrix: Matrix, qubits: list[int]) -> Matrix:
+    """Left multiplies ``unitary`` by ``matrix`` acting on ``qubits``, without
+    expanding ``matrix`` to the full size of ``unitary``.
+
+    The input axes of ``matrix`` are contracted with the axes of its qubits in
+    ``unitary`` (seen as a tensor with one axis per qubit), the output axes are
+    then put back at the same place. For a single qubit, ``unitary`` is simply
+    seen as a ``(left, 2, right)`` tensor, on the middle axis of which
+    ``matrix`` is applied, which avoids any transposition.
+    """
+    dim = len(unitary)
+    nb_qubits = dim.bit_length() - 1
+    gate_size = len(qubits)
+    if gate_size == 1:
+        return (matrix @ unitary.reshape(2 ** qubits[0], 2, -1)).reshape(dim, dim)
+    contracted = np.tensordot(  # pyright: ignore[reportCallIssue]
+        np.reshape(matrix, (2,) * (2 * gate_size)),
+        unitary.reshape((2,) * nb_qubits + (dim,)),
+        axes=(list(range(gate_size, 2 * gate_size)), qubits),
+    )
+    return np.moveaxis(contracted, list(range(gate_size)), qubits).reshape(dim, dim)
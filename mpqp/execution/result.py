@@ -146,7 +146,7 @@ class Sample:
                 self.index = int(bin_str, 2)
                 self.bin_str = bin_str
         else:
-            computed_bin_str = bin(index)[2:].zfill(self.nb_qubits)
+            computed_bin_str = f"{index:0{self.nb_qubits}b}"
             if bin_str is None:
                 self.index = index
                 self.bin_str = computed_bin_str
@@ -447,7 +447,7 @@ class Result:
                 f"{self.job=} has no measure, making the counting impossible"
             )
         n = self.job.measure.nb_qubits
-        x_array = [f"|{bin(i)[2:].zfill(n)}⟩" for i in range(2**n)]
+        x_array = [f"|{i:0{n}b}⟩" for i in range(2**n)]
         y_array = self.counts
         return x_array, y_array
 
@@ -20,6 +20,7 @@ from __future__ import annotations
 import re
 from abc import ABCMeta
 from inspect import getsource
+from numbers import Complex
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -101,6 +102,9 @@ def flatten(lst: ArbitraryNestedSequence[T]) -> list[T]:
     return list(flatten_generator(lst))
 
 
+_WHITESPACES = re.compile(r"\s+")
+
+
 def one_lined_repr(obj: object):
     """One-liner returning a representation of the given object by removing
     extra whitespace.
@@ -108,7 +112,7 @@ def one_lined_repr(obj: object):
     Args:
         obj: The object for which a representation is desired.
     """
-    return re.sub(r"\s+", " ", repr(obj))
+    return _WHITESPACES.sub(" ", repr(obj))
 
 
 @typechecked
@@ -160,29 +164,73 @@ def clean_array(array: list[complex] | npt.NDArray[np.complex64 | np.float32]):
         '[1, 0, 5]'
         >>> clean_array([1.0, 2.0, 3.0])
         '[1, 2, 3]'
+        >>> clean_array([1.0000000001, 1+1e-9j])
+        '[1, 1]'
+        >>> clean_array(np.array([0.70710678+0.5j], dtype=np.complex64))
+        '[0.7071068+0.5j]'
+
+    Note:
+        The rounding is done before checking if the real part is an integer and
+        if the imaginary part is zero, so numerical noise below `10^{-7}` is
+        entirely removed.
 
     """
+    # arrays are used as is, without casting them, only lists are converted
+    array = np.asarray(array)
+    if array.dtype == object:
+        return _format_object_row(array)
+    return _format_cleaned_row(*_round_parts(array))
+
+
+def _round_parts(
+    array: npt.NDArray[Any],
+) -> tuple[npt.NDArray[Any], npt.NDArray[Any], npt.NDArray[np.bool_]]:
+    """Rounds the real and imaginary parts of ``array`` and detects the integer
+    real parts, all at once on the whole array (of any dimension)."""
+    # the parts are formatted through python floats, so they are brought to
+    # double precision first, otherwise single precision noise gets printed
+    real_parts = np.round(array.real.astype(np.float64, copy=False), 7)
+    imag_parts = np.round(array.imag.astype(np.float64, copy=False), 7)
+    return real_parts, imag_parts, np.mod(real_parts, 1) == 0
+
+
+def _format_cleaned_row(
+    real_parts: npt.NDArray[Any],
+    imag_parts: npt.NDArray[Any],
+    are_integers: npt.NDArray[np.bool_],
+) -> str:
+    """Formats a 1D array out of its parts computed by :func:`_round_parts`,
+    this is the only step done element-wise."""
+    cleaned_array = [
+        _clean_element(real, imag, is_integer)
+        for real, imag, is_integer in zip(real_parts, imag_parts, are_integers)
+    ]
+    return "[" + ", ".join(map(str, cleaned_array)) + "]"
+
+
+def _format_object_row(array: npt.NDArray[Any]) -> str:
+    """Formats a 1D array of objects (typically containing ``sympy``
+    expressions) element by element, since such elements cannot be rounded all
+    at once. Numbers are cleaned as in :func:`clean_array`, the other elements
+    are kept as they are."""
     cleaned_array = [
         (
-            int(element.real)
-            if (np.iscomplexobj(element) or isinstance(element, float))
-            and int(element.real) == element
-            else (
-                np.round(element.real, 7)
-                if (np.iscomplexobj(element) and np.imag(element) == 0)
-                or isinstance(element, float)
-                else (
-                    str(np.round(element, 7)).replace("(", "").replace(")", "")
-                    if np.iscomplexobj(element)
-                    else element
-                )
-            )
+            _clean_element(*_round_parts(np.asarray(complex(element))))
+            if isinstance(element, Complex)
+            else element
         )
         for element in array
     ]
     return "[" + ", ".join(map(str, cleaned_array)) + "]"
 
 
+def _clean_element(real: Any, imag: Any, is_integer: Any) -> int | float | str:
+    """Formats a number out of its parts computed by :func:`_round_parts`."""
+    if imag == 0:
+        return int(real) if is_integer else float(real)
+    return str(complex(real, imag)).replace("(", "").replace(")", "")
+
+
 def clean_matrix(matrix: Matrix):
     """Cleans and formats elements of a matrix.
     This function cleans and formats the elements of a matrix. It rounds the real parts of complex numbers
@@ -205,7 +253,14 @@ def clean_matrix(matrix: Matrix):
 
     """
     # TODO: add an option to align cols
-    cleaned_matrix = [clean_array(row) for row in matrix]
+    array = np.asarray(matrix)
+    if array.dtype == object:
+        cleaned_matrix = [_format_object_row(row) for row in array]
+    else:
+        # the rounding is done once for the whole matrix instead of once per row
+        cleaned_matrix = [
+            _format_cleaned_row(*row_parts) for row_parts in zip(*_round_parts(array))
+        ]
     return "[" + ",\n ".join(cleaned_matrix) + "]"
 
 
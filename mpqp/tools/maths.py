@@ -273,14 +273,25 @@ def rand_unitary_2x2_matrix() -> npt.NDArray[np.complex64]:
                [-0.44138577-0.22403602j, -0.72981565-0.47154594j]])
 
     """
-    theta, phi, gamma = np.random.rand(3) * 2 * math.pi
+    return _unitary_2x2_matrices(np.random.rand(1, 3) * 2 * math.pi)[0]
+
+
+def _unitary_2x2_matrices(
+    angles: npt.NDArray[np.float64],
+) -> npt.NDArray[np.complex64]:
+    """Stack of the one-qubit unitaries parametrized by each line
+    ``(theta, phi, gamma)`` of ``angles``, built all at once."""
+    theta, phi, gamma = angles.T
     c, s, eg, ep = (
         np.cos(theta / 2),
         np.sin(theta / 2),
         np.exp(gamma * 1j),
         np.exp(phi * 1j),
     )
-    return np.array([[c, -eg * s], [eg * s, eg * ep * c]])
+    return np.stack(
+        [np.stack([c, -eg * s], axis=-1), np.stack([eg * s, eg * ep * c], axis=-1)],
+        axis=-2,
+    )
 
 
 def rand_product_local_unitaries(nb_qubits: int) -> npt.NDArray[np.complex64]:
@@ -305,7 +316,10 @@ def rand_product_local_unitaries(nb_qubits: int) -> npt.NDArray[np.complex64]:
                    0.05079312-0.52290651j,  0.28163685+0.27906487j]])
 
     """
-    return reduce(np.kron, [rand_unitary_2x2_matrix() for _ in range(nb_qubits - 1)])
+    # all the angles are drawn in one go instead of once per unitary
+    return reduce(
+        np.kron, _unitary_2x2_matrices(np.random.rand(nb_qubits, 3) * 2 * math.pi)
+    )
 
 
 def rand_hermitian_matrix(size: int) -> npt.NDArray[np.complex64]:
@@ -3,17 +3,20 @@ from __future__ import annotations
 from typing import Optional, Sequence
 
 import numpy as np
+import numpy.typing as npt
 import pytest
 from braket.circuits import Circuit as BraketCircuit
 from qiskit import QuantumCircuit as QiskitCircuit
+from sympy import pi, symbols
 from typeguard import TypeCheckError
 
 from mpqp import Barrier, Instruction, Language, QCircuit
-from mpqp.gates import CNOT, CZ, SWAP, Gate, H, Rx, Ry, Rz, S, T, X, Y, Z
+from mpqp.gates import CNOT, CZ, SWAP, TOF, CRk, Gate, H, Rx, Ry, Rz, S, T, X, Y, Z
 from mpqp.measures import BasisMeasure, ExpectationMeasure, Observable
 from mpqp.noise.noise_model import Depolarizing
 from mpqp.tools.errors import UnsupportedBraketFeaturesWarning
 from mpqp.tools.generics import OneOrMany, one_lined_repr
+from mpqp.tools.maths import matrix_eq
 
 
 @pytest.mark.parametrize(
@@ -144,6 +147,59 @@ def test_tensor(
     )
 
 
+@pytest.mark.parametrize(
+    "circuit, expected_matrix",
+    [
+        (
+            QCircuit([H(0), CNOT(0, 1)]),
+            np.array([[1, 0, 1, 0], [0, 1, 0, 1], [0, 1, 0, -1], [1, 0, -1, 0]])
+            / np.sqrt(2),
+        ),
+        (QCircuit([X(1)], nb_qubits=2), np.kron(np.eye(2), np.array([[0, 1], [1, 0]]))),
+        (
+            QCircuit([CNOT(1, 0)]),
+            np.array([[1, 0, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0]]),
+        ),
+        (QCircuit([SWAP(0, 2)]), np.eye(8)[[0, 4, 2, 6, 1, 5, 3, 7]]),
+        (
+            QCircuit([H(0), X(1), H(0)]),
+            np.kron(np.eye(2), np.array([[0, 1], [1, 0]])),
+        ),
+        (QCircuit([X(0), CNOT(0, 1), X(0)]), np.eye(4)[[1, 0, 2, 3]]),
+        (
+            QCircuit([Rx(pi / 2, 0), CNOT(0, 1)]),
+            np.array(
+                [[1, 0, -1j, 0], [0, 1, 0, -1j], [0, -1j, 0, 1], [-1j, 0, 1, 0]]
+            )
+            / np.sqrt(2),
+        ),
+        (
+            QCircuit([CNOT(0, 1), H(0), CNOT(0, 1)]),
+            np.array([[1, 0, 0, 1], [0, 1, 1, 0], [0, 1, -1, 0], [1, 0, 0, -1]])
+            / np.sqrt(2),
+        ),
+        (QCircuit([TOF([2, 0], 1)]), np.eye(8)[[0, 1, 2, 3, 4, 7, 6, 5]]),
+        (
+            QCircuit([CRk(2, 1, 0), X(1), CRk(2, 1, 0)]),
+            np.array([[0, 1, 0, 0], [1, 0, 0, 0], [0, 0, 0, 1j], [0, 0, 1j, 0]]),
+        ),
+    ],
+)
+def test_to_matrix(circuit: QCircuit, expected_matrix: npt.NDArray[np.complex64]):
+    assert matrix_eq(circuit.to_matrix(), expected_matrix)
+
+
+def test_to_matrix_sympy_numbers_are_evaluated():
+    assert QCircuit([Rx(pi / 2, 0), CNOT(0, 1)]).to_matrix().dtype == complex
+
+
+def test_to_matrix_free_symbols_are_kept():
+    theta = symbols("θ")
+    matrix = QCircuit([Rx(theta, 0), CNOT(0, 1)]).to_matrix()
+    assert matrix.dtype == object
+    assert theta in matrix[0, 0].free_symbols
+
+
 @pytest.mark.parametrize(
     "circuit, filter, count",
     [
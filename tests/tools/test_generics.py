@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from sympy import symbols
+
+from mpqp.gates import Rx
+from mpqp.tools.generics import clean_array, clean_matrix
+
+x = symbols("x", real=True)
+
+
+@pytest.mark.parametrize(
+    "array, cleaned",
+    [
+        (
+            [1.234567895546, 2.3456789645645, 3.45678945645],
+            "[1.2345679, 2.345679, 3.4567895]",
+        ),
+        ([1 + 2j, 0.5 - 0.25j], "[1+2j, 0.5-0.25j]"),
+        ([1.0000000001, 1 + 1e-9j], "[1, 1]"),
+        (np.array([0.5, 2.0]), "[0.5, 2]"),
+        (np.array([0.70710678 + 0.5j], dtype=np.complex64), "[0.7071068+0.5j]"),
+        (np.array([0.70710678, 1], dtype=np.float32), "[0.7071068, 1]"),
+        (np.array([x, 1], dtype=object), "[x, 1]"),
+        (np.array([x, 0.5, 2.0], dtype=object), "[x, 0.5, 2]"),
+        (np.array([x, 1.0000000001, 0.5 + 1e-9j], dtype=object), "[x, 1, 0.5]"),
+    ],
+)
+def test_clean_array(array: list[complex] | np.ndarray, cleaned: str):
+    assert clean_array(array) == cleaned
+
+
+@pytest.mark.parametrize(
+    "matrix, cleaned",
+    [
+        (
+            [[1.234567895546, 2.3456789645645], [1 + 0j, 0.5 - 0.25j]],
+            "[[1.2345679, 2.345679],\n [1, 0.5-0.25j]]",
+        ),
+        (
+            np.array([[0.70710678, 0.70710678j], [1, 0]], dtype=np.complex64),
+            "[[0.7071068, 0.7071068j],\n [1, 0]]",
+        ),
+        (np.array([[x, 0], [0.5, 1]], dtype=object), "[[x, 0],\n [0.5, 1]]"),
+        (
+            Rx(x, 0).to_matrix(),
+            "[[cos(x/2), -1.0*I*sin(x/2)],\n [-1.0*I*sin(x/2), cos(x/2)]]",
+        ),
+    ],
+)
+def test_clean_matrix(matrix: list[list[complex]] | np.ndarray, cleaned: str):
+    assert clean_matrix(matrix) == cleaned
@@ -3,7 +3,7 @@ import pytest
 from sympy import symbols
 
 from mpqp.tools.generics import Matrix
-from mpqp.tools.maths import is_hermitian
+from mpqp.tools.maths import is_hermitian, rand_product_local_unitaries
 
 x = symbols("x", real=True)
 
@@ -21,3 +21,11 @@ x = symbols("x", real=True)
 )
 def test_is_hermitian(matrix: Matrix, isHermitian: bool):
     assert is_hermitian(matrix) == isHermitian
+
+
+@pytest.mark.parametrize("nb_qubits", [1, 2, 3])
+def test_rand_product_local_unitaries_shape(nb_qubits: int):
+    assert rand_product_local_unitaries(nb_qubits).shape == (
+        2**nb_qubits,
+        2**nb_qubits,
+    )